@@ -1,16 +1,15 @@
 from __future__ import annotations
 
 import re
-from contextlib import suppress
-from dataclasses import dataclass
-from typing import Any, AnyStr, Generic, TypeVar
+from dataclasses import dataclass, field
+from typing import Any, AnyStr, Generic, Optional, TypeVar
 
 from myre.protocol import MatchLike, PatternLike
 
 _T = TypeVar("_T")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MatchWithOffset(Generic[AnyStr]):
     match: re.Match[AnyStr]
     offset: tuple[int, int] = (0, 0)
@@ -22,14 +21,20 @@ class MatchWithOffset(Generic[AnyStr]):
         return self.match.end(group) + self.offset[1]
 
     def span(self, group: int | str = 0) -> tuple[int, int]:
-        return (self.start(group), self.end(group))
+        start, end = self.match.span(group)
+        return (start + self.offset[0], end + self.offset[1])
 
 
-@dataclass
+@dataclass(slots=True)
 class ComposeMatch(Generic[AnyStr]):
     _hits: tuple[MatchWithOffset[AnyStr], ...]
     _re: PatternLike
     _string: AnyStr
+    # Group n (1-based, numbered across all hits) -> (owning hit, group index within that hit).
+    # Built on the first numbered group lookup; most matches are only asked for their span.
+    _group_map: Optional[list[tuple[MatchWithOffset[AnyStr], int]]] = field(
+        init=False, default=None, repr=False, compare=False
+    )
 
     @property
     def hits(self):
@@ -43,28 +48,21 @@ class ComposeMatch(Generic[AnyStr]):
 
     def span(self, group: int | str = 0) -> tuple[int, int]:
         if group == 0:
-            start = self._hits[0].start(group)
-            end = self._hits[-1].end(group)
-            return start, end
+            if len(self._hits) == 1:
+                return self._hits[0].span()
+            return self._hits[0].start(), self._hits[-1].end()
         if isinstance(group, str):
             for hit in self._hits:
-                with suppress(IndexError):
+                if group in hit.match.re.groupindex:
                     return hit.span(group)
         elif isinstance(group, int):
-            start = 0
-            for hit in self._hits:
-                while start < group:
-                    try:
-                        span = hit.span(start + 1)
-                    except IndexError as e:
-                        group -= start
-                        if group == 0:
-                            raise IndexError("no such group") from e
-                        start = 0
-                        break
-                    if start + 1 == group:
-                        return span
-                    start += 1
+            if (group_map := self._group_map) is None:
+                group_map = self._group_map = [
+                    (hit, index) for hit in self._hits for index in range(1, hit.match.re.groups + 1)
+                ]
+            if 0 < group <= len(group_map):
+                hit, index = group_map[group - 1]
+                return hit.span(index)
         raise IndexError("no such group")
 
     @property
@@ -76,19 +74,14 @@ class ComposeMatch(Generic[AnyStr]):
         return self._string
 
     def groups(self) -> tuple[AnyStr, ...]:
-        groups: tuple[AnyStr, ...] = ()
+        groups: list[AnyStr] = []
         for hit in self._hits:
-            index = 1
-            while True:
-                try:
-                    groups += (hit.match.group(index),)
-                except IndexError:
-                    break
-                index += 1
-        return groups
+            groups.extend(hit.match.groups())
+        return tuple(groups)
 
     def group(self, __group: str | int = 0) -> AnyStr:
-        return self._string[self.start(__group) : self.end(__group)]
+        start, end = self.span(__group)
+        return self._string[start:end]
 
     def __repr__(self):
         return f"<myre.ComposeMatch(re={self.re!r}, string={self.string!r} object; span={self.span()}, match={self.group()})"
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import heapq
 import re
 import sys
-from copy import deepcopy
+from copy import copy
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Iterator, List, NamedTuple, Optional, Set, cast
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional, cast
 
 from typing_extensions import Self, final
 
@@ -22,13 +22,20 @@ class Mode(Enum):
     SEQ = "SEQ"  # Match patterns in sequence (MatchSeq)
 
 
+@lru_cache(maxsize=1024)
+def _compile_str(pattern: str, flag: int) -> re.Pattern:
+    """Compile a regex source, memoized so rebuilding the same combinator skips re.compile."""
+    return re.compile(pattern, flag)
+
+
 def _compile(pattern: Any, flag: int = 0) -> PatternLike:
     if isinstance(pattern, re.Pattern):
         return cast(PatternLike, pattern)
     if isinstance(pattern, str):
-        return cast(PatternLike, re.compile(pattern, flag))
-    if isinstance(pattern, PatternLike):
-        return pattern
+        return cast(PatternLike, _compile_str(pattern, flag))
+    # Nominal check first: the runtime protocol check below probes every protocol member
+    if isinstance(pattern, (Base, PatternLike)):
+        return cast(PatternLike, pattern)
     raise TypeError(f"{pattern} is not a valid pattern")
 
 
@@ -59,24 +66,14 @@ def compile(*patterns: Any, mode: Mode = Mode.ANY, flag: int = 0) -> PatternLike
     if not patterns:
         raise ValueError("At least one pattern is required")
 
-    if mode == Mode.ANY:
-        return MatchAny.compile(*patterns, flag=flag)
-    if mode == Mode.ALL:
-        return MatchALL.compile(*patterns, flag=flag)
-    if mode == Mode.SEQ:
-        return MatchSeq.compile(*patterns, flag=flag)
-    raise ValueError(f"Invalid mode: {mode}")
-
-
-class Scope(NamedTuple):
-    start: int
-    end: int
+    try:
+        matcher = _MODE_CLASSES[mode]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid mode: {mode}") from None
+    return matcher.compile(*patterns, flag=flag)
 
-    def __contains__(self, item: int):  # type: ignore[override]
-        return self.start <= item < self.end
 
-
-@dataclass
+@dataclass(slots=True)
 class Masker:
     """Mask pattern matches with placeholders while preserving positions."""
 
@@ -85,30 +82,47 @@ class Masker:
 
     def mask(self, string: str, pos: int, endpos: int) -> str:
         """Replace pattern matches with placeholder chars of same length."""
-        # Preserve string length by including prefix and suffix
-        result = [string[:pos]]  # Add prefix before pos
-        last_end = pos
+        result: list[str] = []
+        last_end = 0
         for match in self.pattern.finditer(string, pos, endpos):
-            # Add text before match
-            result.append(string[last_end : match.start()])
-            # Add placeholder of same length
-            result.append(self.placeholder * len(match.group()))
-            last_end = match.end()
-        # Add remaining text within search range
-        result.append(string[last_end:endpos])
-        # Add suffix after endpos to preserve full string length
-        result.append(string[endpos:])
+            start, end = match.span()
+            # Add text before match (including the prefix before pos for the first one)
+            result.append(string[last_end:start])
+            # Add placeholder of same length, sized from the span so the match text is never sliced
+            result.append(self.placeholder * (end - start))
+            last_end = end
+        if not result:
+            # Nothing to mask: hand back the input itself instead of a copy
+            return string
+        # Add remaining text, including the suffix after endpos, to preserve full string length
+        result.append(string[last_end:])
         return "".join(result)
 
 
 _MATCH_NONE: PatternLike = cast(PatternLike, re.compile(r"(?!.?)"))
 _MATCH_ALL: PatternLike = cast(PatternLike, re.compile(r".?"))
 
+# Longest input whose matches finditer(cache=True) keeps around
+_CACHE_MAX_LEN = 1 << 16
+
 
-@dataclass
+@dataclass(slots=True)
 class Base:
     p_mask: PatternLike = field(init=False, default=_MATCH_NONE)
     p_deny: PatternLike = field(init=False, default=_MATCH_NONE)
+    # Set by @ and ^ so finditer can skip masking/denying with a single attribute check; the
+    # Masker is built once here rather than on every finditer call
+    _masker: Optional[Masker] = field(init=False, default=None, repr=False, compare=False)
+    _denied: bool = field(init=False, default=False, repr=False, compare=False)
+    # Matches of the last input scanned with cache=True, keyed by (string, pos, endpos)
+    _memo: Optional[tuple[tuple[str, int, int], tuple[MatchLike, ...]]] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        # Compiled regexes and the patterns tuple are never mutated in place, so sharing them is
+        # safe and skips deepcopy's slow generic walk of the whole pattern graph.
+        return copy(self)
 
     def __and__(self, other: Any) -> MatchALL:
         return MatchALL.compile(self, other)
@@ -125,8 +139,10 @@ class Base:
         return SplitMatch.compile(self, other)
 
     def __xor__(self, other: Any) -> Self:
-        self = deepcopy(self)
-        self.p_deny = MatchAny.compile(self.p_deny, other)
+        self = copy(self)
+        self.p_deny = _extend(self.p_deny, other)
+        self._denied = True
+        self._memo = None
         return self
 
     def __matmul__(self, other: Any) -> Self:
@@ -151,14 +167,14 @@ class Base:
             - Use ' ' (space) for word matching
             - Use any character that makes sense in your context
         """
-        self = deepcopy(self)
+        self = copy(self)
+        self._memo = None
+        placeholder = "."
         if isinstance(other, tuple) and len(other) == 2:
-            mask_pattern, placeholder = other
-            self.p_mask = MatchAny.compile(self.p_mask, mask_pattern)
-            # Store placeholder as an attribute on p_mask for later retrieval
-            object.__setattr__(self.p_mask, "_placeholder", str(placeholder)[0])
-        else:
-            self.p_mask = MatchAny.compile(self.p_mask, other)
+            other, placeholder = other
+            placeholder = str(placeholder)[0]
+        self.p_mask = _extend(self.p_mask, other)
+        self._masker = Masker(self.p_mask, placeholder=placeholder)
         return self
 
     def _findnext(
@@ -167,69 +183,363 @@ class Base:
         raise NotImplementedError
 
     @final
-    def finditer(self, string: str, pos: int = 0, endpos: int = sys.maxsize) -> Iterator[MatchLike]:
-        # Get placeholder from p_mask if set, otherwise use default
-        placeholder = getattr(self.p_mask, "_placeholder", ".") if self.p_mask != _MATCH_NONE else "."
-        masker = Masker(self.p_mask, placeholder=placeholder)
-        masked = masker.mask(string, pos, endpos)
-        if self.p_deny.search(masked, pos, endpos):
+    def finditer(
+        self, string: str, pos: int = 0, endpos: int = sys.maxsize, cache: bool = False
+    ) -> Iterator[MatchLike]:
+        """Iterate over non-overlapping matches, like re.Pattern.finditer.
+
+        With ``cache=True`` the matches of the last input (up to 64K characters) are kept, so
+        repeating a call on the same arguments, e.g. search() then findall(), skips the rescan.
+        """
+        if cache and len(string) <= _CACHE_MAX_LEN:
+            key = (string, pos, endpos)
+            # Read the memo once: a scan in another thread may replace it at any point
+            if (memo := self._memo) is None or memo[0] != key:
+                memo = self._memo = (key, tuple(self._finditer(string, pos, endpos)))
+            return iter(memo[1])
+        return self._finditer(string, pos, endpos)
+
+    def _finditer(self, string: str, pos: int, endpos: int) -> Iterator[MatchLike]:
+        # Without @ or ^ applied there is nothing to mask or deny, so scan the input as is
+        if self._masker is None:
+            masked = string
+        else:
+            masked = self._masker.mask(string, pos, endpos)
+        if self._denied and self.p_deny.search(masked, pos, endpos):
             return
+        rebind = masked is not string
         for hit, _ in self._findnext(masked, pos, endpos):
             # Since mask preserves positions, yield the hit with original string
-            if isinstance(hit, re.Match):
+            if type(hit) is re.Match:
                 # Wrap with original string context
-                from myre.match import MatchWithOffset
-
-                yield cast(MatchLike, ComposeMatch((MatchWithOffset(hit, (0, 0)),), self, string))
+                yield cast(MatchLike, ComposeMatch((MatchWithOffset(hit),), self, string))
             else:
                 # For ComposeMatch, just update the string reference
-                if isinstance(hit, ComposeMatch):
+                if rebind and isinstance(hit, ComposeMatch):
                     yield cast(MatchLike, ComposeMatch(hit.hits, hit.re, string))
                 else:
                     yield hit
 
-    def findall(self, string: str, pos: int = 0, endpos: int = sys.maxsize) -> List[str]:
-        return [match.group() for match in self.finditer(string, pos, endpos)]
+    def findall(self, string: str, pos: int = 0, endpos: int = sys.maxsize, cache: bool = False) -> List[str]:
+        return [match.group() for match in self.finditer(string, pos, endpos, cache)]
+
+    def search(self, string: str, pos: int = 0, endpos: int = sys.maxsize, cache: bool = False) -> Optional[MatchLike]:
+        return next(self.finditer(string, pos, endpos, cache), None)
+
+
+def _extend(current: PatternLike, other: Any) -> MatchAny:
+    """Add ``other`` to a mask or deny pattern, leaving out the never-matching default.
+
+    Keeping ``_MATCH_NONE`` as a branch would cost an extra engine pass per scan, and in a
+    fused alternation its empty prefix would disable sre's first-character prefilter.
+    """
+    if current is _MATCH_NONE:
+        return MatchAny.compile(other)
+    return MatchAny.compile(current, other)
+
 
-    def search(self, string: str, pos: int = 0, endpos: int = sys.maxsize) -> Optional[MatchLike]:
-        return next(self.finditer(string, pos, endpos), None)
+# Numbered backreferences and conditionals would point at the wrong group once a
+# pattern is joined with others into one regex.
+_NUMBERED_REF = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+def _fusable(patterns: tuple[PatternLike, ...]) -> Optional[tuple[re.Pattern, ...]]:
+    """Return the sub-patterns if they can be joined into one regex without changing their meaning.
+
+    That requires at least two plain ``str`` regexes sharing the same flags and not relying on
+    numbered group references. Composed patterns keep their own Python-level matching.
+    """
+    if len(patterns) < 2:
+        return None
+    if not all(isinstance(p, re.Pattern) and isinstance(p.pattern, str) for p in patterns):
+        return None
+    regexes = cast(tuple[re.Pattern, ...], patterns)
+    flags = regexes[0].flags
+    if any(p.flags != flags or _NUMBERED_REF.search(p.pattern) for p in regexes):
+        return None
+    return regexes
+
+
+def _fuse(patterns: tuple[PatternLike, ...]) -> Optional[re.Pattern]:
+    """Join plain regex sub-patterns into one alternation scanned in a single C-level pass.
+
+    Branches are wrapped in non-capturing groups: a capturing wrapper would stop sre from
+    building its first-character prefilter for the alternation, which makes scanning text
+    without hits several times slower. Returns None whenever fusing could change the meaning
+    of a branch (composed patterns, mixed flags, numbered backreferences, clashing group names).
+    """
+    if (regexes := _fusable(patterns)) is None:
+        return None
+    try:
+        return _compile_str("|".join(f"(?:{p.pattern})" for p in regexes), regexes[0].flags)
+    except re.error:
+        return None
+
+
+def _offset_hits(hit: Any) -> tuple[MatchWithOffset, ...]:
+    """Return the offset hits a sub-pattern match contributes to a composed match.
+
+    ``re.Match`` cannot be subclassed, so an exact type check covers the common case before
+    falling back to ``isinstance``. Matches of any other kind contribute nothing.
+    """
+    if type(hit) is re.Match:
+        return (MatchWithOffset(hit),)
+    if isinstance(hit, ComposeMatch):
+        return hit.hits
+    return ()
+
+
+# Sources with none of these characters match themselves verbatim (unless re.X is set)
+_PLAIN_LITERAL = re.compile(r"[^\\.^$*+?{}\[\]|()]*")
+
+
+def _literal_sources(patterns: tuple[PatternLike, ...]) -> Optional[tuple[str, ...]]:
+    """Return the sources of fusable sub-patterns that are all plain literals, else None.
+
+    For these ``str.find`` locates the earliest possible hit with a C-level substring search,
+    far faster than the fused regex stepping through text its prefilter cannot skip. Under
+    re.I only ASCII literals qualify, and they are returned lower-cased.
+    """
+    if (regexes := _fusable(patterns)) is None or regexes[0].flags & re.VERBOSE:
+        return None
+    # An empty source matches everywhere, so there is nothing to skip ahead to
+    if not all(p.pattern and _PLAIN_LITERAL.fullmatch(p.pattern) for p in regexes):
+        return None
+    if regexes[0].flags & re.IGNORECASE:
+        if not all(p.pattern.isascii() for p in regexes):
+            return None
+        return tuple(p.pattern.lower() for p in regexes)
+    return tuple(p.pattern for p in regexes)
+
+
+def _find_first(literals: tuple[str, ...], string: str, pos: int, endpos: int) -> int:
+    """Return the earliest index in ``string[pos:endpos]`` where any literal occurs, or -1."""
+    # Each search stops at the earliest occurrence found so far, so an early hit stays cheap
+    pos = min(pos, len(string))
+    first = -1
+    for literal in literals:
+        limit = endpos if first == -1 else first + len(literal)
+        if (index := string.find(literal, pos, limit)) != -1 and (first == -1 or index < first):
+            first = index
+    return first
+
+
+def _find_first_folded(literals: tuple[str, ...], string: str, pos: int, endpos: int) -> int:
+    """`_find_first` for lower-cased literals under re.I, or ``pos`` when it cannot tell.
+
+    ASCII text keeps its length when lower-cased, so windows of it can be searched in place
+    of the case-insensitive regex. Windows double in size, which keeps an early hit cheap.
+    Literals are never empty (see `_literal_sources`), so no hit can start at ``endpos``.
+    """
+    if not string.isascii():
+        return pos
+    endpos = min(endpos, len(string))
+    overlap = max(0, max(map(len, literals)) - 1)
+    window = 1 << 12
+    while pos < endpos:
+        stop = min(endpos, pos + window)
+        chunk = string[pos : min(endpos, stop + overlap)].lower()
+        # Only occurrences starting before ``stop`` are sure to fit in the chunk
+        if (first := _find_first(literals, chunk, 0, len(chunk))) != -1 and first < stop - pos:
+            return pos + first
+        pos = stop
+        window <<= 1
+    return -1
+
+
+@lru_cache(maxsize=1024)
+def _tagged_scan(regexes: tuple[PatternLike, ...]) -> tuple[re.Pattern, tuple[Optional[re.Pattern], ...]]:
+    """Fused alternation with an empty marker group closing each branch, and each group's owner.
+
+    The marker is the last group its branch closes, so ``Match.lastindex`` names the branch
+    that matched. Unlike a capturing group around the whole branch, an empty group at its end
+    leaves sre's first-character prefilter intact. Only called for regexes `_fuse` accepted.
+    """
+    fusable = cast(tuple[re.Pattern, ...], regexes)
+    owners: list[Optional[re.Pattern]] = [None]
+    for regex in fusable:
+        owners.extend([None] * regex.groups)
+        owners.append(regex)
+    tagged = _compile_str("|".join(f"(?:{p.pattern})()" for p in fusable), fusable[0].flags)
+    return tagged, tuple(owners)
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _fused_scan(regexes: tuple[PatternLike, ...]) -> tuple[Optional[re.Pattern], Optional[tuple[str, ...]]]:
+    """Fused alternation and literal sources for a tuple of plain regexes, memoized.
+
+    `_compile_str` hands out one object per (source, flag), so rebuilding the same MatchAny
+    finds its scan here instead of re-checking, re-joining and re-hashing every source.
+    """
+    if (fused := _fuse(regexes)) is None:
+        return None, None
+    return fused, _literal_sources(regexes)
+
+
+@dataclass(slots=True)
 class MatchAny(Base):
     patterns: tuple[PatternLike, ...]
+    _fused: Optional[re.Pattern] = field(init=False, default=None, repr=False, compare=False)
+    _literals: Optional[tuple[str, ...]] = field(init=False, default=None, repr=False, compare=False)
+    # Fused regex with branch markers and the sub-pattern owning each of its groups; built on
+    # the first scan that needs to know the branch, since findall only needs the matched text.
+    # One attribute, so a concurrent scan never sees the regex without its owners.
+    _tagged: Optional[tuple[re.Pattern, tuple[Optional[re.Pattern], ...]]] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    _prepared: bool = field(init=False, default=False, repr=False, compare=False)
+
+    def _prepare(self) -> None:
+        # Deferred to the first scan, so the intermediate nodes of a chain like p1 | p2 | p3
+        # never compile an alternation of their own
+        if all(type(pattern) is re.Pattern for pattern in self.patterns):
+            self._fused, self._literals = _fused_scan(self.patterns)
+        self._prepared = True
 
     def _findnext(
         self, string: str, pos: int = 0, endpos: int = sys.maxsize
     ) -> Iterator[tuple[MatchLike, PatternLike]]:
-        pq: List[tuple[int, MatchLike, Iterator[MatchLike], PatternLike]] = []
-        indices: Set[int] = set()
+        if not self._prepared:
+            self._prepare()
+        if self._fused is not None:
+            yield from self._findnext_fused(string, pos, endpos)
+            return
+        if len(self.patterns) == 1:
+            # A lone pattern has nothing to merge with: pass its hits straight through
+            pattern = self.patterns[0]
+            for hit in pattern.finditer(string, pos, endpos):
+                yield hit, pattern
+            return
+        yield from self._findnext_merged(string, pos, endpos)
 
-        for pattern in self.patterns:
-            follow = pattern.finditer(string, pos, endpos)
-            while hit := next(follow, None):
-                if any(i in indices for i in range(*hit.span())):
-                    continue
-                indices.update(range(*hit.span()))
-                heapq.heappush(pq, (hit.start(), hit, follow, pattern))
-                break
-
-        while pq:
-            _, hit, follow, pattern = heapq.heappop(pq)
-            yield hit, pattern
-            while hit := next(follow, None):
-                if any(i in indices for i in range(*hit.span())):
-                    continue
-                indices.update(range(*hit.span()))
-                heapq.heappush(pq, (hit.start(), hit, follow, pattern))
-                break
+    def _findnext_merged(
+        self, string: str, pos: int, endpos: int, last_empty: int = -1
+    ) -> Iterator[tuple[MatchLike, PatternLike]]:
+        """Merge the hits of every sub-pattern scanned on its own, leftmost first.
+
+        ``last_empty`` is the position of an empty match already yielded right before ``pos``.
+        """
+        # One pending hit per pattern; exhausted patterns park at sys.maxsize. With the usual
+        # handful of patterns a C-level min()/index() over a flat list beats heap bookkeeping.
+        patterns = self.patterns
+        exhausted = sys.maxsize
+        follows = [pattern.finditer(string, pos, endpos) for pattern in patterns]
+        heads = [next(follow, None) for follow in follows]
+        starts = [exhausted if hit is None else hit.start() for hit in heads]
+
+        # Hits come out in start order, so a single cursor is enough to keep them disjoint.
+        # Like re, an empty match may not repeat at the position of the previous empty match.
+        # re clamps pos to the string, so the cursor must too or a clamped hit rescans forever.
+        next_allowed = min(pos, endpos, len(string))
+        while (start := min(starts, default=exhausted)) != exhausted:
+            index = starts.index(start)  # ties go to the earlier pattern
+            pattern = patterns[index]
+            if start < next_allowed:
+                # Overlaps a hit already taken: rescan this pattern from where the free text begins.
+                follow = follows[index] = pattern.finditer(string, next_allowed, endpos)
+            else:
+                hit = cast(MatchLike, heads[index])
+                if (end := hit.end()) != start or start != last_empty:
+                    yield hit, pattern
+                    next_allowed = end
+                    if end == start:
+                        last_empty = start
+                follow = follows[index]
+            heads[index] = next_hit = next(follow, None)
+            starts[index] = exhausted if next_hit is None else next_hit.start()
+
+    def _findnext_fused(self, string: str, pos: int, endpos: int) -> Iterator[tuple[MatchLike, PatternLike]]:
+        if (pos := self._scan_start(string, pos, endpos)) == -1:
+            return
+        if (tagged := self._tagged) is None:
+            tagged = self._tagged = _tagged_scan(self.patterns)
+        regex, owners = tagged
+        last_empty = -1
+        for hit in regex.finditer(string, pos, endpos):
+            # The branch comes straight from the hit's marker group. Re-run it on its own so
+            # callers see its groups, not the fused ones.
+            branch = cast(re.Pattern, owners[cast(int, hit.lastindex)])
+            start, end = hit.span()
+            sub = branch.match(string, start, endpos)
+            if sub is None or sub.end() != end:
+                # The empty match just yielded here forced the engine past the branch's first
+                # choice, which the branch alone cannot reproduce. The merge applies the same
+                # rule to each sub-pattern's own scan, so let it take over from this hit.
+                yield from self._findnext_merged(string, start, endpos, last_empty)
+                return
+            yield cast(MatchLike, sub), cast(PatternLike, branch)
+            if start == end:
+                last_empty = start
+
+    def _scan_start(self, string: str, pos: int, endpos: int) -> int:
+        """Return where the fused scan can begin, or -1 when no hit is possible."""
+        if (literals := self._literals) is None:
+            return pos
+        # No hit can start before the first occurrence of any literal, or at all without one
+        assert self._fused is not None
+        if self._fused.flags & re.IGNORECASE:
+            return _find_first_folded(literals, string, pos, endpos)
+        return _find_first(literals, string, pos, endpos)
+
+    def findall(self, string: str, pos: int = 0, endpos: int = sys.maxsize, cache: bool = False) -> List[str]:
+        if cache or type(self) is not MatchAny or self._masker is not None or self._denied:
+            return Base.findall(self, string, pos, endpos, cache)
+        if not self._prepared:
+            self._prepare()
+        if (fused := self._fused) is None:
+            return Base.findall(self, string, pos, endpos, cache)
+        # Only the matched text is needed, so which branch took each hit does not matter
+        if (pos := self._scan_start(string, pos, endpos)) == -1:
+            return []
+        if not fused.groups:
+            return fused.findall(string, pos, endpos)
+        return [hit.group() for hit in fused.finditer(string, pos, endpos)]
 
     @classmethod
     def compile(cls, *patterns: Any, flag: int = 0) -> Self:
-        return cls(tuple(_compile(pattern, flag) for pattern in patterns))
+        compiled = tuple(_compile(pattern, flag) for pattern in patterns)
+        if cls is MatchAny:
+            compiled = _drop_repeated(_splice(cls, compiled))
+        elif cls is MatchALL:
+            compiled = _splice(cls, compiled)
+        return cls(compiled)
+
+
+def _splice(kind: type[MatchAny], patterns: tuple[PatternLike, ...]) -> tuple[PatternLike, ...]:
+    """Splice plain nested sub-patterns of the same kind into the enclosing MatchAny or MatchALL.
+
+    Without a mask or deny pattern, a nested MatchAny picks the same hits as its sub-patterns
+    listed in its place (leftmost first, earlier pattern on ties, an empty match at most once
+    per position), and flattening lets chains like ``p1 | p2 | p3`` reach the fused
+    single-regex scan. A nested MatchALL likewise
+    contributes the first hit of each of its sub-patterns, so ``(a & b) & c`` is ``a & b & c``.
+    """
+    flat: list[PatternLike] = []
+    for pattern in patterns:
+        if type(pattern) is kind and pattern._masker is None and not pattern._denied:
+            flat.extend(cast(MatchAny, pattern).patterns)
+        else:
+            flat.append(pattern)
+    return tuple(flat)
+
 
+def _drop_repeated(patterns: tuple[PatternLike, ...]) -> tuple[PatternLike, ...]:
+    """Keep the first of repeated plain regex alternatives: a later copy can never win.
 
-@dataclass
+    Only for MatchAny; a repeated MatchALL slot still adds its own groups to the match.
+    """
+    seen: set[re.Pattern] = set()
+    unique: list[PatternLike] = []
+    for pattern in patterns:
+        if type(pattern) is re.Pattern:
+            if pattern in seen:
+                continue
+            seen.add(pattern)
+        unique.append(pattern)
+    return tuple(unique)
+
+
+@dataclass(slots=True)
 class MatchALL(MatchAny):
     def _findnext(
         self, string: str, pos: int = 0, endpos: int = sys.maxsize
@@ -245,14 +555,16 @@ class MatchALL(MatchAny):
 
         # 为每个pattern收集第一个匹配（允许重叠）
         for pattern in self.patterns:
+            if type(pattern) is re.Pattern:
+                # A plain regex needs just one search; stop at the first pattern without a hit
+                if (found := pattern.search(string, pos, endpos)) is None:
+                    return
+                all_hits.append(MatchWithOffset(found))
+                continue
             for match in pattern.finditer(string, pos, endpos):
-                if isinstance(match, re.Match):
-                    all_hits.append(MatchWithOffset(match))
-                    break  # 每个pattern只取第一个匹配
-                elif isinstance(match, ComposeMatch):
-                    # 对于ComposeMatch，取其所有hits（保留完整信息）
-                    for hit in match.hits:
-                        all_hits.append(hit)
+                # 对于ComposeMatch，取其所有hits（保留完整信息）
+                if hits := _offset_hits(match):
+                    all_hits.extend(hits)
                     break  # 每个pattern只取第一个匹配
             else:
                 # 如果任何一个pattern没有匹配，则整个MatchALL失败
@@ -263,7 +575,7 @@ class MatchALL(MatchAny):
         yield cast(MatchLike, ComposeMatch(sorted_hits, self, string)), self
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchSeq(MatchAny):
     def _findnext(
         self, string: str, pos: int = 0, endpos: int = sys.maxsize
@@ -272,22 +584,24 @@ class MatchSeq(MatchAny):
             return
         hits: list[MatchWithOffset] = []
 
+        patterns = self.patterns
         index = 0
-        for hit, pattern in super()._findnext(string, pos, endpos):
-            if pattern == self.patterns[index]:
+        # Explicit base call: zero-argument super() does not work in a slots=True dataclass
+        for hit, pattern in MatchAny._findnext(self, string, pos, endpos):
+            # Identity first: hits come back tagged with the very objects in self.patterns,
+            # so the field-by-field dataclass comparison only runs for equal duplicates
+            expected = patterns[index]
+            if pattern is expected or pattern == expected:
                 index += 1
-                if isinstance(hit, re.Match):
-                    hits.append(MatchWithOffset(hit))
-                elif isinstance(hit, ComposeMatch):
-                    hits.extend(hit.hits)
+                hits.extend(_offset_hits(hit))
 
-            if index == len(self.patterns):
+            if index == len(patterns):
                 yield cast(MatchLike, ComposeMatch(tuple(hits), self, string)), self
                 index = 0
                 hits = []
 
 
-@dataclass
+@dataclass(slots=True)
 class SplitMatch(Base):
     """Split string by delimiter pattern, then match in each segment.
 
@@ -318,26 +632,17 @@ class SplitMatch(Base):
 
         pattern = self.patterns[0]
 
-        # Find all delimiter positions
-        delimiter_matches = list(self.delimiter.finditer(string, pos, endpos))
-
-        # Build segments: from pos to first delimiter, between delimiters, after last delimiter
-        segment_starts = [pos]
-        segment_ends = []
-
-        for delim_match in delimiter_matches:
-            segment_ends.append(delim_match.start())
-            segment_starts.append(delim_match.end())
-
-        segment_ends.append(endpos)
-
-        # Process each segment
-        for seg_start, seg_end in zip(segment_starts, segment_ends, strict=False):
-            if seg_start >= seg_end:  # Skip empty segments
-                continue
-
-            # Match the pattern in this segment
-            for match in pattern.finditer(string, seg_start, seg_end):
+        # Walk the delimiters lazily, matching each segment as soon as its end is known
+        seg_start = pos
+        for delim_match in self.delimiter.finditer(string, pos, endpos):
+            if seg_start < delim_match.start():  # Skip empty segments
+                for match in pattern.finditer(string, seg_start, delim_match.start()):
+                    yield match, pattern
+            seg_start = delim_match.end()
+
+        # Segment after the last delimiter
+        if seg_start < endpos:
+            for match in pattern.finditer(string, seg_start, endpos):
                 yield match, pattern
 
     @classmethod
@@ -355,3 +660,7 @@ class SplitMatch(Base):
             raise ValueError("SplitMatch requires at least 2 patterns: (match_pattern, delimiter)")
         compiled = tuple(_compile(p, flag) for p in patterns)
         return cls(compiled)
+
+
+# Pattern class built by compile() for each Mode
+_MODE_CLASSES: dict[Mode, type[MatchAny]] = {Mode.ANY: MatchAny, Mode.ALL: MatchALL, Mode.SEQ: MatchSeq}
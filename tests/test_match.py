@@ -59,3 +59,19 @@ class TestComposeMatchWithoutOffset:
             )
             # assert ComposeMatch[str](self.hits[:1], self.pattern).group(key) == self.hits[0].match.group(key)
             # assert ComposeMatch[str](self.hits[-1:], self.pattern).group(key) == self.hits[-1].match.group(key)
+
+    def test_span_numbered_across_hits(self):
+        compose = ComposeMatch[str](self.hits, self.pattern, self.content)
+        assert compose.span(2) == self.hits[0].match.span(2)
+        assert compose.span(3) == self.hits[1].match.span(1)
+        assert compose.span(4) == self.hits[1].match.span(2)
+        for key in (5, -1, "missing"):
+            try:
+                compose.span(key)
+            except IndexError:
+                continue
+            raise AssertionError(f"group {key!r} should not exist")
+
+    def test_groups_across_hits(self):
+        compose = ComposeMatch[str](self.hits, self.pattern, self.content)
+        assert compose.groups() == self.hits[0].match.groups() + self.hits[1].match.groups()
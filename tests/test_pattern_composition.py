@@ -15,17 +15,26 @@ Composition patterns tested:
 
 import re
 import unittest
-from myre import MatchAny, MatchALL, Mode
+from copy import deepcopy
+
+from myre import MatchAny, MatchALL, MatchSeq, Mode
 
 
 class TestOrOperator(unittest.TestCase):
     """Tests for | (OR) operator"""
 
+    @classmethod
+    def setUpClass(cls):
+        # Operators return new patterns, so the operands can be shared across tests
+        cls.hello = MatchAny.compile(r"hello")
+        cls.world = MatchAny.compile(r"world")
+        cls.foo = MatchAny.compile(r"foo")
+        cls.hello_or_world = MatchAny.compile(r"hello", r"world")
+        cls.foo_or_bar = MatchAny.compile(r"foo", r"bar")
+
     def test_matchany_or_matchany(self):
         """Test combining two MatchAny patterns with |"""
-        p1 = MatchAny.compile(r"hello", r"world")
-        p2 = MatchAny.compile(r"foo", r"bar")
-        combined = p1 | p2
+        combined = self.hello_or_world | self.foo_or_bar
 
         matches = combined.findall("hello world foo bar")
         self.assertEqual(len(matches), 4)
@@ -34,46 +43,89 @@ class TestOrOperator(unittest.TestCase):
 
     def test_or_creates_new_matchany(self):
         """Test that | operator creates new MatchAny instance"""
-        p1 = MatchAny.compile(r"hello")
-        p2 = MatchAny.compile(r"world")
-        combined = p1 | p2
+        combined = self.hello | self.world
 
         self.assertIsInstance(combined, MatchAny)
         # Original patterns unchanged (immutability)
-        self.assertEqual(p1.findall("hello world"), ["hello"])
-        self.assertEqual(p2.findall("hello world"), ["world"])
+        self.assertEqual(self.hello.findall("hello world"), ["hello"])
+        self.assertEqual(self.world.findall("hello world"), ["world"])
 
     def test_multiple_or_chains(self):
         """Test chaining multiple | operations"""
-        p1 = MatchAny.compile(r"hello")
-        p2 = MatchAny.compile(r"world")
-        p3 = MatchAny.compile(r"foo")
-
-        combined = p1 | p2 | p3
+        combined = self.hello | self.world | self.foo
         matches = combined.findall("hello world foo")
         self.assertEqual(len(matches), 3)
 
+    def test_or_flattens_plain_matchany(self):
+        """Test | splices plain MatchAny operands but keeps masked ones whole"""
+        p1 = self.hello
+        p2 = MatchAny.compile(r"world", r"foo")
+        combined = p1 | p2
+
+        self.assertEqual(combined.patterns, p1.patterns + p2.patterns)
+        self.assertEqual(combined.findall("foo hello world"), ["foo", "hello", "world"])
+
+        masked = p1 @ r"\d+"
+        self.assertIn(masked, (masked | p2).patterns)
+
+    def test_or_drops_repeated_alternatives(self):
+        """Test a repeated alternative is kept once, in its first position"""
+        combined = MatchAny.compile(r"worl", r"world", r"world") | self.hello | r"worl"
+
+        self.assertEqual(combined.patterns, (re.compile(r"worl"), re.compile(r"world"), re.compile(r"hello")))
+        self.assertEqual(combined.findall("hello world"), re.findall(r"worl|world|hello", "hello world"))
+
+    def test_or_of_composed_patterns_matches_alternation(self):
+        """Test OR over composed patterns picks hits like a plain alternation"""
+        digits = MatchAny.compile(r"\d+")
+        words = MatchAny.compile(r"\w+")
+        text = "123abc 456def"
+
+        # Built directly so the operands stay nested instead of being flattened by |
+        self.assertEqual(MatchAny((digits, words)).findall(text), re.findall(r"\d+|\w+", text))
+        self.assertEqual(MatchAny((words, digits)).findall(text), re.findall(r"\w+|\d+", text))
+
+    def test_or_flattened_matches_nested_with_empty_alternatives(self):
+        """Test flattening by | keeps the results of the nested form when alternatives match empty"""
+        x_star = MatchAny.compile(r"x*")
+        empty = MatchAny.compile(r"")
+        for text in ("ab", "axxb", ""):
+            with self.subTest(text=text):
+                flattened = [m.span() for m in (x_star | empty).finditer(text)]
+                nested = [m.span() for m in MatchAny((x_star, empty)).finditer(text)]
+                self.assertEqual(flattened, nested)
+                self.assertEqual(flattened, [m.span() for m in re.finditer(r"x*|", text)])
+
 
 class TestAndOperator(unittest.TestCase):
     """Tests for & (AND) operator"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.hello_and_world = MatchALL.compile(r"hello", r"world")
+        cls.foo_and_bar = MatchALL.compile(r"foo", r"bar")
+
     def test_matchall_and_matchall(self):
         """Test combining two MatchALL patterns with &"""
-        # p1 requires 'hello' and 'world'
-        # p2 requires 'foo' and 'bar'
-        p1 = MatchALL.compile(r"hello", r"world")
-        p2 = MatchALL.compile(r"foo", r"bar")
-        combined = p1 & p2
+        # hello_and_world requires 'hello' and 'world'
+        # foo_and_bar requires 'foo' and 'bar'
+        combined = self.hello_and_world & self.foo_and_bar
 
         # All 4 patterns must match
         matches = combined.findall("hello world foo bar")
         self.assertEqual(len(matches), 1)
 
+    def test_and_flattens_plain_matchall(self):
+        """Test & splices plain MatchALL operands and keeps their groups"""
+        combined = self.hello_and_world & self.foo_and_bar
+        self.assertEqual(combined.patterns, self.hello_and_world.patterns + self.foo_and_bar.patterns)
+
+        grouped = MatchALL.compile(r"(h)ello", r"(w)orld") & r"(f)oo"
+        self.assertEqual(grouped.search("foo world hello").groups(), ("f", "w", "h"))
+
     def test_and_creates_new_matchall(self):
         """Test that & operator creates new MatchALL instance"""
-        p1 = MatchALL.compile(r"hello", r"world")
-        p2 = MatchALL.compile(r"foo", r"bar")
-        combined = p1 & p2
+        combined = self.hello_and_world & self.foo_and_bar
 
         self.assertIsInstance(combined, MatchALL)
 
@@ -109,6 +161,20 @@ class TestMaskOperator(unittest.TestCase):
         # Should return original text with spaces, not 'testxxxvalue'
         self.assertEqual(matches[0], text)
 
+    def test_mask_only_within_search_range(self):
+        """Test @ masks between pos and endpos and keeps positions in the original text"""
+        pattern = MatchAny.compile(r"ab_c") @ (r"\d", "_")
+        matches = list(pattern.finditer("1ab2c ab3c", 1, 5))
+        self.assertEqual([m.group() for m in matches], ["ab2c"])
+        self.assertEqual(matches[0].span(), (1, 5))
+        self.assertEqual(pattern.findall("ab c"), [])
+
+    def test_repeated_mask_joins_patterns(self):
+        """Test chained @ collects every mask pattern into one alternation"""
+        pattern = MatchAny.compile(r"a_c") @ (r"\d", "_") @ (r"-", "_")
+        self.assertEqual(pattern.p_mask.patterns, (re.compile(r"\d"), re.compile(r"-")))
+        self.assertEqual(pattern.findall("a1c a-c abc"), ["a1c", "a-c"])
+
     def test_mask_chaining(self):
         """Test chaining @ with other operators"""
         # Create pattern, mask it, then combine with another
@@ -121,6 +187,45 @@ class TestMaskOperator(unittest.TestCase):
         self.assertEqual(len(matches), 3)
 
 
+class TestSplitOperator(unittest.TestCase):
+    """Tests for / (SPLIT) operator"""
+
+    def test_split_matches_each_segment(self):
+        """Test matches are found per segment with positions in the original text"""
+        pattern = MatchAny.compile(r"\d{2}") / r"[,-]"
+        matches = list(pattern.finditer("12,34-56"))
+        self.assertEqual([m.group() for m in matches], ["12", "34", "56"])
+        self.assertEqual([m.span() for m in matches], [(0, 2), (3, 5), (6, 8)])
+
+    def test_split_keeps_matches_inside_segments(self):
+        """Test a match never spans a delimiter"""
+        pattern = MatchAny.compile(r"\w+") / r"\|"
+        self.assertEqual(pattern.findall("ab||cd|e"), ["ab", "cd", "e"])
+        self.assertEqual(pattern.findall("ab||cd|e", 1, 6), ["b", "cd"])
+
+
+class TestSeqOperator(unittest.TestCase):
+    """Tests for + (SEQ) operator"""
+
+    def test_seq_matches_in_order(self):
+        """Test a sequence match covers its parts in order"""
+        pattern = MatchAny.compile(r"\d+") + r"[a-z]+"
+        self.assertEqual(pattern.findall("x 12 ab 34 cd"), ["12 ab", "34 cd"])
+
+    def test_seq_with_repeated_pattern(self):
+        """Test the same pattern may fill consecutive slots"""
+        part = MatchAny.compile("a") ^ "b"
+        pattern = part + part
+        self.assertEqual([m.span() for m in pattern.finditer("a a a a")], [(0, 3), (4, 7)])
+
+    def test_seq_slot_follows_branch_taken(self):
+        """Test a hit fills the slot of the alternative that actually matched"""
+        # After the empty match at 0, re must take "a" and then look past the hit for "c";
+        # the hit cannot be reproduced by the branch alone but still belongs to it
+        pattern = MatchSeq.compile(r"", r"(a)??(?=a?c)")
+        self.assertEqual(pattern.search("ac").span(), (0, 1))
+
+
 class TestUnifiedCompile(unittest.TestCase):
     """Tests for unified myre.compile() function"""
 
@@ -242,6 +347,25 @@ class TestImmutability(unittest.TestCase):
         # masked with r'\d+' mask should still match 'hello' since digits are masked
         self.assertIsNotNone(masked.search("hello123world"))
 
+    def test_xor_after_mask_keeps_mask(self):
+        """Test that ^ on a masked pattern keeps the mask and leaves the original alone"""
+        masked = MatchAny.compile(r"test_{3}value") @ (r"\d+", "_")
+        denied = masked ^ r"forbidden"
+
+        self.assertEqual(denied.findall("test123value"), ["test123value"])
+        self.assertEqual(denied.findall("test123value forbidden"), [])
+        self.assertEqual(masked.findall("test123value forbidden"), ["test123value"])
+
+    def test_deepcopy_shares_compiled_patterns(self):
+        """Test deepcopy returns an equal pattern without recompiling its sub-patterns"""
+        p1 = MatchAny.compile(r"hello", r"world") @ (r"\d+", "_")
+        copied = deepcopy(p1)
+
+        self.assertIsNot(copied, p1)
+        self.assertEqual(copied, p1)
+        self.assertIs(copied.patterns, p1.patterns)
+        self.assertEqual(copied.findall("hel1lo world"), p1.findall("hel1lo world"))
+
 
 class TestMatchALLWithOperators(unittest.TestCase):
     """Specific tests for MatchALL behavior with various operators"""
@@ -20,9 +20,105 @@ Test Strategy:
     3. Assert identical results
 """
 
+import random
 import re
+import sys
+from functools import lru_cache
+
 import pytest
 from myre import MatchALL, MatchAny
+from myre.protocol import MatchLike, PatternLike
+
+
+@lru_cache(maxsize=None)
+def _re(pattern, flags=0):
+    """Compile a traditional pattern once per test session."""
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=None)
+def _my(*patterns, flag=0):
+    """Compile a myre MatchAny once per test session; tests never mutate patterns."""
+    return MatchAny.compile(*patterns, flag=flag)
+
+
+def _assert_search_equiv(pattern, string, pos=0, endpos=sys.maxsize):
+    """Search with both engines, assert they agree, and return the re result."""
+    trad_result = _re(pattern).search(string, pos, endpos)
+    myre_result = _my(pattern).search(string, pos, endpos)
+    assert (trad_result is None) == (myre_result is None)
+    if trad_result is not None:
+        assert myre_result.span() == trad_result.span()
+        assert myre_result.group() == trad_result.group()
+    return trad_result
+
+
+# (pattern, string, pos, endpos, expected span or None)
+SEARCH_CASES = [
+    (r"x", "abc", 0, sys.maxsize, None),
+    (r"b", "abc", 0, sys.maxsize, (1, 2)),
+    (r"abc", "abcabc", 0, sys.maxsize, (0, 3)),
+    (r"abc", "abcabc", 1, sys.maxsize, (3, 6)),
+    (r"abc", "abcabc", 3, sys.maxsize, (3, 6)),
+    (r"abc", "abcabc", 4, sys.maxsize, None),
+    (r"abc", "abcabc", 0, 3, (0, 3)),
+    (r"abc", "abcabc", 0, 2, None),
+    # x* matches zero characters at position 0
+    (r"x*", "axx", 0, sys.maxsize, (0, 0)),
+    (r"x+", "axx", 0, sys.maxsize, (1, 3)),
+    (r"x", "aaa", 0, sys.maxsize, None),
+]
+
+# (alternative patterns, string, pos, expected matches)
+FINDALL_CASES = [
+    ((r":+",), "a:b::c:::d", 0, [":", "::", ":::"]),
+    # From pos=2, the matches are at (3,5) and (6,9)
+    ((r":+",), "a:b::c:::d", 2, ["::", ":::"]),
+    ((r":+",), "abc", 0, []),
+    (("cat", "dog", "bat"), "cat dog bat", 0, ["cat", "dog", "bat"]),
+    ((r"\d+",), "123 abc 456 def 789", 0, ["123", "456", "789"]),
+]
+
+# (pattern, string, pos, endpos, expected spans)
+FINDITER_CASES = [
+    (r":+", "a:b::c", 0, sys.maxsize, [(1, 2), (3, 5)]),
+    (r"abc", "abc123abc456", 3, 12, [(6, 9)]),
+]
+
+# Alternatives fuzzed against re by TestEdgeCases
+FUZZ_PATTERNS = [
+    (r":+",),
+    (r"a*",),
+    (r"ab|ba",),
+    (r"[ab]+",),
+    ("ab", "ba"),
+    ("a", ":", "b:"),
+    (r"a+", r":*"),
+]
+
+
+@pytest.fixture(scope="session")
+def email_corpus():
+    return "Contact us at support@example.com or sales@example.com"
+
+
+@pytest.fixture(scope="session")
+def url_corpus():
+    return "Visit https://example.com or http://test.org"
+
+
+@pytest.fixture(scope="session")
+def log_corpus():
+    return """
+        [INFO] Service started
+        [ERROR] Database connection failed
+        [WARN] High memory usage
+        """
+
+
+@pytest.fixture(scope="session")
+def phone_corpus():
+    return "Call 555-123-4567 or 555-987-6543"
 
 
 class TestSearchMethod:
@@ -33,80 +129,11 @@ class TestSearchMethod:
     where the pattern produces a match.
     """
 
-    def test_search_basic(self):
-        """Basic search functionality."""
-        string = "abc"
-
-        # Traditional
-        trad_pattern = re.compile(r"x")
-        trad_result = trad_pattern.search(string)
-        assert trad_result is None
-
-        trad_pattern2 = re.compile(r"b")
-        trad_result2 = trad_pattern2.search(string)
-        assert trad_result2 is not None
-        assert trad_result2.group() == "b"
-
-        # myre - should behave identically
-        myre_pattern = MatchAny.compile(r"x")
-        myre_result = myre_pattern.search(string)
-        assert myre_result is None
-
-        myre_pattern2 = MatchAny.compile(r"b")
-        myre_result2 = myre_pattern2.search(string)
-        assert myre_result2 is not None
-        assert myre_result2.group() == "b"
-
-    def test_search_with_position(self):
-        """Test search with pos parameter."""
-        string = "abcabc"
-
-        # Traditional
-        trad = re.compile(r"abc")
-        assert trad.search(string, 0).span() == (0, 3)
-        assert trad.search(string, 1).span() == (3, 6)
-        assert trad.search(string, 3).span() == (3, 6)
-        assert trad.search(string, 4) is None
-
-        # myre
-        myre_pat = MatchAny.compile(r"abc")
-        assert myre_pat.search(string, pos=0).span() == (0, 3)
-        assert myre_pat.search(string, pos=1).span() == (3, 6)
-        assert myre_pat.search(string, pos=3).span() == (3, 6)
-        assert myre_pat.search(string, pos=4) is None
-
-    def test_search_with_endpos(self):
-        """Test search with endpos parameter."""
-        string = "abcabc"
-
-        # Traditional
-        trad = re.compile(r"abc")
-        assert trad.search(string, 0, 3).span() == (0, 3)
-        assert trad.search(string, 0, 2) is None
-
-        # myre
-        myre_pat = MatchAny.compile(r"abc")
-        assert myre_pat.search(string, pos=0, endpos=3).span() == (0, 3)
-        assert myre_pat.search(string, pos=0, endpos=2) is None
-
-    def test_search_star_plus(self):
-        """Test search with * and + quantifiers."""
-        # From test_re.py: test_search_star_plus
-
-        # x* matches zero characters at position 0
-        assert re.search(r"x*", "axx").span() == (0, 0)
-        myre_pattern = MatchAny.compile(r"x*")
-        assert myre_pattern.search("axx").span() == (0, 0)
-
-        # x+ matches one or more x's
-        assert re.search(r"x+", "axx").span() == (1, 3)
-        myre_pattern2 = MatchAny.compile(r"x+")
-        assert myre_pattern2.search("axx").span() == (1, 3)
-
-        # x in string with no x
-        assert re.search(r"x", "aaa") is None
-        myre_pattern3 = MatchAny.compile(r"x")
-        assert myre_pattern3.search("aaa") is None
+    @pytest.mark.parametrize("pattern,string,pos,endpos,expected", SEARCH_CASES)
+    def test_search(self, pattern, string, pos, endpos, expected):
+        """search() with pos/endpos, from test_re.py: test_search_star_plus."""
+        trad_result = _assert_search_equiv(pattern, string, pos, endpos)
+        assert (trad_result and trad_result.span()) == expected
 
     def test_search_alternatives(self):
         """Test search with | (alternation)."""
@@ -117,13 +144,13 @@ class TestSearchMethod:
         string_ac = "ac"
 
         # Traditional
-        trad = re.compile(r"(ab|ba)")
+        trad = _re(r"(ab|ba)")
         assert trad.search(string_ab).span() == (0, 2)
         assert trad.search(string_ba).span() == (0, 2)
         assert trad.search(string_ac) is None
 
         # myre - | operator becomes MatchAny
-        myre_pat = MatchAny.compile("ab", "ba")
+        myre_pat = _my("ab", "ba")
         assert myre_pat.search(string_ab).span() == (0, 2)
         assert myre_pat.search(string_ba).span() == (0, 2)
         assert myre_pat.search(string_ac) is None
@@ -135,11 +162,11 @@ class TestSearchMethod:
         string = "abcd abc bcd bx"
 
         # \b matches word boundary
-        trad = re.search(r"\b(b.)\b", string)
+        trad = _re(r"\b(b.)\b").search(string)
         assert trad is not None
         assert trad.group(1) == "bx"
 
-        myre_pat = MatchAny.compile(r"\b(b.)\b")
+        myre_pat = _my(r"\b(b.)\b")
         myre_result = myre_pat.search(string)
         assert myre_result is not None
         assert myre_result.group() == "bx"
@@ -151,10 +178,10 @@ class TestSearchMethod:
         string = "1aa! a"
 
         # \d\D\w\W\s\S all match
-        trad = re.search(r"\d\D\w\W\s\S", string)
+        trad = _re(r"\d\D\w\W\s\S").search(string)
         assert trad.group(0) == "1aa! a"
 
-        myre_pat = MatchAny.compile(r"\d\D\w\W\s\S")
+        myre_pat = _my(r"\d\D\w\W\s\S")
         myre_result = myre_pat.search(string)
         assert myre_result.group() == "1aa! a"
 
@@ -171,88 +198,49 @@ class TestFindAllMethod:
         string = "abc"
 
         # Traditional
-        trad = re.compile(r"x")
+        trad = _re(r"x")
         assert trad.findall(string) == []
 
-        trad2 = re.compile(r"[abc]")
+        trad2 = _re(r"[abc]")
         trad2_result = trad2.findall(string)
         assert len(trad2_result) == 3
-        assert set(trad2_result) == {"a", "b", "c"}
+        assert trad2_result == ["a", "b", "c"]
 
         # myre
-        myre_pat = MatchAny.compile(r"x")
+        myre_pat = _my(r"x")
         assert myre_pat.findall(string) == []
 
-        myre_pat2 = MatchAny.compile(r"[abc]")
+        myre_pat2 = _my(r"[abc]")
         myre_result2 = myre_pat2.findall(string)
         assert len(myre_result2) == 3
-        assert set(myre_result2) == {"a", "b", "c"}
+        assert myre_result2 == ["a", "b", "c"]
 
-    def test_findall_colon_sequences(self):
-        """Test findall with colon sequences."""
-        # From test_re.py: test_re_findall
+    @pytest.mark.parametrize("patterns,string,pos,expected", FINDALL_CASES)
+    def test_findall(self, patterns, string, pos, expected):
+        """findall() with pos, from test_re.py: test_re_findall; alternatives are joined with |."""
+        trad_result = _re("|".join(patterns)).findall(string, pos)
+        myre_result = _my(*patterns).findall(string, pos)
 
-        string = "a:b::c:::d"
+        assert trad_result == expected
+        assert myre_result == expected
 
-        # Traditional
-        trad_result = re.findall(r":+", string)
-        assert trad_result == [":", "::", ":::"]
 
-        # myre - should match same sequences
-        myre_pat = MatchAny.compile(r":+")
-        myre_result = myre_pat.findall(string)
-        assert myre_result == trad_result
+class TestFindAllBytes:
+    """
+    Test findall() on bytes input, using precompiled bytes patterns.
+    """
 
-    def test_findall_with_position(self):
-        """Test findall with pos parameter."""
-        string = "a:b::c:::d"
+    @pytest.mark.parametrize("patterns,string,pos,expected", FINDALL_CASES)
+    def test_findall_bytes(self, patterns, string, pos, expected):
+        """Bytes results match re and decode to the str results."""
+        compiled = tuple(_re(pattern.encode("ascii")) for pattern in patterns)
+        data = string.encode("ascii")
 
-        # Traditional - use compiled pattern (PatternLike behavior)
-        trad_pattern = re.compile(r":+")
-        trad_result = trad_pattern.findall(string, 2)
-        # From pos=2, finditer returns matches at (3,5) and (6,9)
-        assert trad_result == ["::", ":::"]
+        trad_result = _re(b"|".join(pattern.pattern for pattern in compiled)).findall(data, pos)
+        myre_result = _my(*compiled).findall(data, pos)
 
-        # myre - should match PatternLike behavior
-        myre_pat = MatchAny.compile(r":+")
-        myre_result = myre_pat.findall(string, pos=2)
         assert myre_result == trad_result
-
-    def test_findall_empty_matches(self):
-        """Test findall returns empty list for no matches."""
-        # From test_re.py: test_re_findall
-
-        assert re.findall(r":+", "abc") == []
-
-        myre_pat = MatchAny.compile(r":+")
-        assert myre_pat.findall("abc") == []
-
-    def test_findall_multiple_patterns(self):
-        """Test findall with multiple alternative patterns."""
-        string = "cat dog bat"
-
-        # Traditional: (cat|dog|bat)
-        trad = re.compile(r"cat|dog|bat")
-        trad_result = trad.findall(string)
-        assert trad_result == ["cat", "dog", "bat"]
-
-        # myre: MatchAny with alternatives
-        myre_pat = MatchAny.compile("cat", "dog", "bat")
-        myre_result = myre_pat.findall(string)
-        assert myre_result == ["cat", "dog", "bat"]
-
-    def test_findall_numbers(self):
-        """Test findall with numbers."""
-        string = "123 abc 456 def 789"
-
-        # Traditional
-        trad_result = re.findall(r"\d+", string)
-        assert trad_result == ["123", "456", "789"]
-
-        # myre
-        myre_pat = MatchAny.compile(r"\d+")
-        myre_result = myre_pat.findall(string)
-        assert myre_result == ["123", "456", "789"]
+        assert [match.decode("ascii") for match in myre_result] == expected
 
 
 class TestFindIterMethod:
@@ -268,77 +256,128 @@ class TestFindIterMethod:
         string = "abc"
 
         # Traditional
-        trad = re.compile(r"x")
-        trad_matches = list(trad.finditer(string))
-        assert len(trad_matches) == 0
-
-        trad2 = re.compile(r"[abc]")
-        trad2_matches = list(trad2.finditer(string))
-        assert len(trad2_matches) == 3
-
-        # myre
-        myre_pat = MatchAny.compile(r"x")
-        myre_matches = list(myre_pat.finditer(string))
-        assert len(myre_matches) == 0
-
-        myre_pat2 = MatchAny.compile(r"[abc]")
-        myre_matches2 = list(myre_pat2.finditer(string))
-        assert len(myre_matches2) == 3
-
-    def test_finditer_match_objects(self):
-        """Test that finditer returns proper match objects."""
-        string = "a:b::c"
-
-        # Traditional
-        trad = re.compile(r":+")
-        trad_matches = list(trad.finditer(string))
+        assert next(_re(r"x").finditer(string), None) is None
+        assert sum(1 for _ in _re(r"[abc]").finditer(string)) == 3
 
         # myre
-        myre_pat = MatchAny.compile(r":+")
-        myre_matches = list(myre_pat.finditer(string))
-
-        assert len(trad_matches) == len(myre_matches) == 2
-
-        for trad_match, myre_match in zip(trad_matches, myre_matches):
-            # Both should have same span
-            assert trad_match.span() == myre_match.span()
-            # Both should have same group() content
-            assert trad_match.group() == myre_match.group()
-
-    def test_finditer_with_position(self):
-        """Test finditer with pos and endpos parameters."""
-        string = "abc123abc456"
-
-        # Traditional
-        trad = re.compile(r"abc")
-        trad_matches = list(trad.finditer(string, 3, 12))
-        assert len(trad_matches) == 1
-        assert trad_matches[0].span() == (6, 9)
-
-        # myre
-        myre_pat = MatchAny.compile(r"abc")
-        myre_matches = list(myre_pat.finditer(string, pos=3, endpos=12))
-        assert len(myre_matches) == 1
-        assert myre_matches[0].span() == (6, 9)
+        assert next(_my(r"x").finditer(string), None) is None
+        assert sum(1 for _ in _my(r"[abc]").finditer(string)) == 3
+
+    @pytest.mark.parametrize("pattern,string,pos,endpos,expected", FINDITER_CASES)
+    def test_finditer(self, pattern, string, pos, endpos, expected):
+        """finditer() yields matches with the same spans and text as re."""
+        trad_iter = _re(pattern).finditer(string, pos, endpos)
+        myre_iter = _my(pattern).finditer(string, pos, endpos)
+
+        spans = []
+        for trad_m, myre_m in zip(trad_iter, myre_iter, strict=True):
+            assert myre_m.span() == trad_m.span()
+            assert myre_m.group() == trad_m.group()
+            spans.append(trad_m.span())
+        assert spans == expected
 
     def test_finditer_iterator_protocol(self):
         """Test that finditer returns a proper iterator."""
         string = "a b c d e"
 
         # Traditional
-        trad = re.compile(r"\w")
+        trad = _re(r"\w")
         trad_iter = trad.finditer(string)
         # Should be able to iterate multiple times? No, it's an iterator
         trad_first = next(trad_iter)
         assert trad_first.group() == "a"
 
         # myre
-        myre_pat = MatchAny.compile(r"\w")
+        myre_pat = _my(r"\w")
         myre_iter = myre_pat.finditer(string)
         myre_first = next(myre_iter)
         assert myre_first.group() == "a"
 
 
+class TestFindIterCache:
+    """
+    Test finditer(cache=True), which keeps the matches of the last input.
+    """
+
+    def test_cached_results_match_uncached(self):
+        string = "a:b::c:::d"
+        myre_pat = MatchAny.compile(r":+")
+
+        assert myre_pat.search(string, cache=True).span() == (1, 2)
+        assert myre_pat.findall(string, cache=True) == [":", "::", ":::"]
+        assert myre_pat.findall(string, 2, cache=True) == ["::", ":::"]
+        assert [m.span() for m in myre_pat.finditer(string, cache=True)] == [
+            m.span() for m in myre_pat.finditer(string)
+        ]
+
+    def test_cache_not_shared_with_derived_patterns(self):
+        string = "abc123"
+        myre_pat = MatchAny.compile(r"abc")
+        assert myre_pat.findall(string, cache=True) == ["abc"]
+
+        denied = myre_pat ^ r"\d"
+        assert denied.findall(string, cache=True) == []
+        assert myre_pat.findall(string, cache=True) == ["abc"]
+
+    def test_findall_cache_replaces_last_input(self):
+        myre_pat = MatchAny.compile("cat", "dog")
+        first = myre_pat.search("a cat", cache=True)
+        assert myre_pat.search("a cat", cache=True) is first
+
+        # findall(cache=True) on another input keeps that input's matches instead
+        assert myre_pat.findall("a dog", cache=True) == ["dog"]
+        assert myre_pat.search("a cat", cache=True) is not first
+
+
+class TestFastPathDispatch:
+    """
+    Test that alternations scanned in one pass give the same results as the re alternation.
+    """
+
+    @pytest.mark.parametrize(
+        "string",
+        ["a dog", "x" * 10_000 + "bat" + "x" * 10_000 + "cat", "no such animal here", ""],
+    )
+    def test_literal_alternatives_match_re(self, string):
+        trad = _re("cat|dog|bat")
+        myre_pat = _my("cat", "dog", "bat")
+
+        assert myre_pat.findall(string) == trad.findall(string)
+        assert [m.span() for m in myre_pat.finditer(string)] == [m.span() for m in trad.finditer(string)]
+        for pos, endpos in ((1, sys.maxsize), (0, 5), (3, len(string) - 2)):
+            trad_match = trad.search(string, pos, endpos)
+            myre_match = myre_pat.search(string, pos, endpos)
+            assert (myre_match and myre_match.span()) == (trad_match and trad_match.span())
+
+    def test_literal_skip_ahead_without_literal(self):
+        # Long text holding none of the literals, only their prefixes
+        string = "ca do ba " * 50_000
+        myre_pat = _my("cat", "dog", "bat")
+        assert myre_pat.findall(string) == []
+        assert myre_pat.search(string) is None
+        assert next(myre_pat.finditer(string, 7), None) is None
+
+    def test_non_literal_alternatives_match_re(self):
+        string = "cat 42 dog 7"
+        assert _my(r"\d+", "cat").findall(string) == _re(r"\d+|cat").findall(string)
+        assert _my(r"\d+", "cat").search(string).group() == "cat"
+
+    def test_large_literal_input_matches_re(self):
+        string = "cat dog bat " * 100_000
+        myre_pat = MatchAny.compile("cat", "dog", "bat")
+        assert myre_pat.findall(string) == _re("cat|dog|bat").findall(string)
+
+    def test_alphabet_alternation_matches_separate_scans(self):
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        string = "The quick brown fox jumps over the lazy dog. " * 20_000
+        myre_pat = MatchAny.compile(*letters)
+
+        separate = sorted(
+            (m.start(), m.group()) for letter in letters for m in _re(letter).finditer(string)
+        )
+        assert myre_pat.findall(string) == [group for _, group in separate]
+
+
 class TestMatchObjectProtocol:
     """
     Test that match objects returned by search/finditer implement MatchLike protocol.
@@ -355,7 +394,7 @@ class TestMatchObjectProtocol:
         string = "hello world"
 
         # Traditional
-        trad_match = re.search(r"hello", string)
+        trad_match = _re(r"hello").search(string)
         assert hasattr(trad_match, "re")
         assert hasattr(trad_match, "string")
         assert trad_match.string == string
@@ -372,7 +411,7 @@ class TestMatchObjectProtocol:
         string = "abc"
 
         # Traditional
-        trad_match = re.search(r"b", string)
+        trad_match = _re(r"b").search(string)
         assert trad_match.start() == 1
         assert trad_match.end() == 2
         assert trad_match.span() == (1, 2)
@@ -389,7 +428,7 @@ class TestMatchObjectProtocol:
         string = "hello"
 
         # Traditional
-        trad_match = re.search(r"(hello)", string)
+        trad_match = _re(r"(hello)").search(string)
         assert trad_match.group() == "hello"
         assert trad_match.group(0) == "hello"
         assert trad_match.group(1) == "hello"
@@ -412,38 +451,19 @@ class TestEdgeCases:
 
     def test_empty_string(self):
         """Test patterns against empty string."""
-        string = ""
-
-        # Traditional
-        trad_match = re.search(r"x*", string)
-        assert trad_match is not None
-        assert trad_match.span() == (0, 0)
-
-        # myre
-        myre_pat = MatchAny.compile(r"x*")
-        myre_match = myre_pat.search(string)
-        assert myre_match is not None
-        assert myre_match.span() == (0, 0)
+        assert _assert_search_equiv(r"x*", "").span() == (0, 0)
 
     def test_zero_width_match(self):
         """Test zero-width matches."""
-        string = "abc"
-
-        # Traditional - ^ matches at position 0
-        trad_match = re.search(r"^", string)
-        assert trad_match.span() == (0, 0)
-
-        # myre - should also match
-        myre_pat = MatchAny.compile(r"^")
-        myre_match = myre_pat.search(string)
-        assert myre_match.span() == (0, 0)
+        # ^ matches at position 0
+        assert _assert_search_equiv(r"^", "abc").span() == (0, 0)
 
     def test_overlapping_matches(self):
         """Test behavior with overlapping potential matches."""
         string = "aaa"
 
         # Traditional - findall finds non-overlapping matches
-        trad_result = re.findall(r"aa", string)
+        trad_result = _re(r"aa").findall(string)
         assert trad_result == ["aa"]  # Only one, not 'aa', 'aa'
 
         # myre - should also find non-overlapping
@@ -453,33 +473,25 @@ class TestEdgeCases:
 
     def test_special_characters(self):
         """Test special regex characters."""
-        string = "a.b"
-
-        # Traditional
-        trad_match = re.search(r"a\.b", string)
-        assert trad_match is not None
-        assert trad_match.group() == "a.b"
-
-        # myre
-        myre_pat = MatchAny.compile(r"a\.b")
-        myre_match = myre_pat.search(string)
-        assert myre_match is not None
-        assert myre_match.group() == "a.b"
+        assert _assert_search_equiv(r"a\.b", "a.b").group() == "a.b"
 
     def test_unicode_strings(self):
         """Test with Unicode characters."""
-        string = "café hello"
+        assert _assert_search_equiv(r"café", "café hello").group() == "café"
 
-        # Traditional
-        trad_match = re.search(r"café", string)
-        assert trad_match is not None
-        assert trad_match.group() == "café"
+    @pytest.mark.parametrize("patterns", FUZZ_PATTERNS)
+    def test_agrees_with_re_on_random_text(self, patterns):
+        """Seeded random texts over a tiny alphabet; alternatives are joined with |."""
+        rng = random.Random(0)
+        trad = _re("|".join(patterns))
+        myre_pat = _my(*patterns)
 
-        # myre
-        myre_pat = MatchAny.compile(r"café")
-        myre_match = myre_pat.search(string)
-        assert myre_match is not None
-        assert myre_match.group() == "café"
+        for _ in range(200):
+            string = "".join(rng.choice("ab:") for _ in range(rng.randrange(21)))
+            assert myre_pat.findall(string) == trad.findall(string), string
+            trad_match = trad.search(string)
+            myre_match = myre_pat.search(string)
+            assert (myre_match and myre_match.span()) == (trad_match and trad_match.span()), string
 
 
 class TestRealWorldPatterns:
@@ -487,67 +499,63 @@ class TestRealWorldPatterns:
     Test real-world pattern usage scenarios.
     """
 
-    def test_email_pattern(self):
+    def test_email_pattern(self, email_corpus):
         """Test email matching pattern."""
-        string = "Contact us at support@example.com or sales@example.com"
+        string = email_corpus
 
         # Traditional
-        trad_pattern = re.compile(r"[\w.]+@[\w.]+")
+        trad_pattern = _re(r"[\w.]+@[\w.]+")
         trad_matches = trad_pattern.findall(string)
         assert len(trad_matches) == 2
         assert "support@example.com" in trad_matches
 
         # myre
-        myre_pat = MatchAny.compile(r"[\w.]+@[\w.]+")
+        myre_pat = _my(r"[\w.]+@[\w.]+")
         myre_matches = myre_pat.findall(string)
         assert len(myre_matches) == 2
         assert "support@example.com" in myre_matches
 
-    def test_url_pattern(self):
+    def test_url_pattern(self, url_corpus):
         """Test URL matching pattern."""
-        string = "Visit https://example.com or http://test.org"
+        string = url_corpus
 
         # Traditional
-        trad_pattern = re.compile(r"https?://\S+")
+        trad_pattern = _re(r"https?://\S+")
         trad_matches = trad_pattern.findall(string)
         assert len(trad_matches) == 2
 
         # myre
-        myre_pat = MatchAny.compile(r"https?://\S+")
+        myre_pat = _my(r"https?://\S+")
         myre_matches = myre_pat.findall(string)
         assert len(myre_matches) == 2
 
-    def test_log_level_pattern(self):
+    def test_log_level_pattern(self, log_corpus):
         """Test log level extraction."""
-        string = """
-        [INFO] Service started
-        [ERROR] Database connection failed
-        [WARN] High memory usage
-        """
+        string = log_corpus
 
         # Traditional
-        trad_pattern = re.compile(r"\[(ERROR|WARN|INFO)\]")
+        trad_pattern = _re(r"\[(ERROR|WARN|INFO)\]")
         trad_matches = trad_pattern.findall(string)
         assert len(trad_matches) == 3
         assert "ERROR" in trad_matches
 
         # myre - using | for alternatives
-        myre_pat = MatchAny.compile(r"\[ERROR\]", r"\[WARN\]", r"\[INFO\]")
+        myre_pat = _my(r"\[ERROR\]", r"\[WARN\]", r"\[INFO\]")
         myre_matches = myre_pat.findall(string)
         assert len(myre_matches) == 3
         assert "[ERROR]" in myre_matches
 
-    def test_phone_number_pattern(self):
+    def test_phone_number_pattern(self, phone_corpus):
         """Test phone number extraction."""
-        string = "Call 555-123-4567 or 555-987-6543"
+        string = phone_corpus
 
         # Traditional
-        trad_pattern = re.compile(r"\d{3}-\d{3}-\d{4}")
+        trad_pattern = _re(r"\d{3}-\d{3}-\d{4}")
         trad_matches = trad_pattern.findall(string)
         assert len(trad_matches) == 2
 
         # myre
-        myre_pat = MatchAny.compile(r"\d{3}-\d{3}-\d{4}")
+        myre_pat = _my(r"\d{3}-\d{3}-\d{4}")
         myre_matches = myre_pat.findall(string)
         assert len(myre_matches) == 2
 
@@ -562,7 +570,7 @@ class TestFlagSupport:
         string = "Hello HELLO hello"
 
         # Traditional
-        trad_pattern = re.compile(r"hello", re.IGNORECASE)
+        trad_pattern = _re(r"hello", re.IGNORECASE)
         trad_matches = trad_pattern.findall(string)
         assert len(trad_matches) == 3
 
@@ -576,7 +584,7 @@ class TestFlagSupport:
         string = "abc\n123\ndef"
 
         # Traditional
-        trad_pattern = re.compile(r"^\w+", re.MULTILINE)
+        trad_pattern = _re(r"^\w+", re.MULTILINE)
         trad_matches = trad_pattern.findall(string)
         assert trad_matches == ["abc", "123", "def"]
 
@@ -591,7 +599,7 @@ class TestFlagSupport:
         string = "abc\ndef"
 
         # Traditional
-        trad_pattern = re.compile(r".+", re.DOTALL)
+        trad_pattern = _re(r".+", re.DOTALL)
         trad_match = trad_pattern.search(string)
         assert trad_match.group() == string
 
@@ -737,7 +745,7 @@ class TestMatchALLAndOperator:
         string = "password: SecurePass123"
 
         # Traditional lookaheads
-        trad = re.compile(r"(?=.*[a-z])(?=.*[A-Z])(?=.*\d)")
+        trad = _re(r"(?=.*[a-z])(?=.*[A-Z])(?=.*\d)")
         trad_result = trad.search(string)
         assert trad_result is not None, "Traditional lookahead should match"
 
@@ -787,24 +795,18 @@ class TestProtocolCompliance:
 
     def test_pattern_like_protocol_check(self):
         """Test that myre patterns are recognized as PatternLike."""
-        from myre.protocol import PatternLike
-
         myre_pat = MatchAny.compile(r"hello")
         assert isinstance(myre_pat, PatternLike)
 
     def test_match_like_protocol_check(self):
         """Test that myre match objects are recognized as MatchLike."""
-        from myre.protocol import MatchLike
-
         myre_pat = MatchAny.compile(r"hello")
         myre_match = myre_pat.search("hello world")
         assert isinstance(myre_match, MatchLike)
 
     def test_re_pattern_is_pattern_like(self):
         """Test that re.Pattern is also recognized as PatternLike."""
-        from myre.protocol import PatternLike
-
-        re_pat = re.compile(r"hello")
+        re_pat = _re(r"hello")
         # re.Pattern should match PatternLike protocol
         # (since it has search/findall/finditer methods)
         # Note: isinstance check may not work for Protocol without @runtime_checkable
@@ -16,29 +16,97 @@ Based on: Python standard library test_re.py
 """
 
 import re
+import sys
 import unittest
+from functools import lru_cache
+
 from myre import MatchAny, MatchALL
 
 
+@lru_cache(maxsize=None)
+def _my(*patterns, flag=0):
+    """Compile a MatchAny once per test run; tests never mutate patterns."""
+    return MatchAny.compile(*patterns, flag=flag)
+
+
+# Input texts shared by several tests
+_TEXT_HELLO_WORLD = "hello world"
+_TEXT_HELLO_WORLD_UPPER = "HELLO WORLD"
+_TEXT_XXX = "xxx"
+_TEXT_ABCD = "abcd"
+_TEXT_DIGITS = "1 2 3 4"
+_EXPECTED_DIGITS = ("1", "2", "3", "4")
+
+# Stdlib patterns the myre results are compared against
+_RE_TWO_GROUPS = re.compile(r"(\w)(\w+)")
+_RE_WORL_WORLD_HELLO = re.compile(r"worl|world|hello")
+_RE_CAT_DOG_I = re.compile(r"cat|Dog", re.IGNORECASE)
+_RE_DIGITS_OR_WORD = re.compile(r"\d+|\w+")
+_RE_X_STAR_OR_EMPTY = re.compile(r"(?:x*)|(?:)")
+_RE_EMPTY_B_OR_A = re.compile(r"(?:)|(?:b?)|(?:a)")
+_RE_B_OR_EMPTY = re.compile(r"(?:B)|(?:)")
+_RE_EMPTY_OR_X_I = re.compile(r"(?:)|(?:x)", re.IGNORECASE)
+_RE_EMPTY_OR_A_BEFORE_B = re.compile(r"|(a)(?=b)")
+_RE_Z = re.compile(r"z")
+_RE_Z_OR_Q = re.compile(r"z|q")
+_RE_Z_BYTES = re.compile(rb"z")
+
+# Attributes and methods required by the MatchLike protocol
+_REQUIRED_MATCH_ATTRS = frozenset({"re", "string", "start", "end", "span", "group", "groups"})
+
+# (compiled re pattern, text, expected span or None)
+_STAR_PLUS_CASES = tuple(
+    (re.compile(pattern), text, span)
+    for pattern, text, span in (
+        (r"a*", _TEXT_XXX, (0, 0)),
+        (r"a+", _TEXT_XXX, None),
+        (r"a+", "xxxaaa", (3, 6)),
+    )
+)
+_ANCHORED_CASES = tuple(
+    (re.compile(pattern), text, span)
+    for pattern, text, span in (
+        (r"^a*", _TEXT_XXX, (0, 0)),
+        (r"^x*", _TEXT_XXX, (0, 3)),
+        (r"^x+", _TEXT_XXX, (0, 3)),
+        (r"^x", _TEXT_XXX, (0, 1)),
+        (r"^a", _TEXT_XXX, None),
+    )
+)
+# (compiled re pattern, text, expected matches)
+_FINDALL_CASES = tuple(
+    (re.compile(pattern), text, matches)
+    for pattern, text, matches in (
+        (r"\d+", _TEXT_DIGITS, _EXPECTED_DIGITS),
+        (r"a+", "aaaaa", ("aaaaa",)),
+    )
+)
+
+
 class ReSearchTests(unittest.TestCase):
     """Tests for search() method - adapted from test_re.py"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.hello = _my(r"hello")
+
     def test_search_star_plus(self):
         """Test * and + quantifiers"""
         # From stdlib: test_search_star_plus
-        self.assertEqual(re.search(r"a*", "xxx").span(), (0, 0))
-        self.assertEqual(re.search(r"a*", "xxx").string, "xxx")
-        self.assertEqual(re.search(r"a+", "xxx"), None)
-        self.assertEqual(re.search(r"a+", "xxxaaa").span(), (3, 6))
-        self.assertEqual(re.search(r"a+", "xxxaaa").string, "xxxaaa")
+        for pattern, text, expected in _STAR_PLUS_CASES:
+            with self.subTest(pattern=pattern.pattern, text=text):
+                match = pattern.search(text)
+                self.assertEqual(match and match.span(), expected)
+                if match:
+                    self.assertEqual(match.string, text)
 
     def test_search_basic(self):
         """Test basic search functionality"""
         # myre should behave identically
-        pattern = MatchAny.compile(r"hello")
-        self.assertIsNotNone(pattern.search("hello world"))
-        self.assertIsNone(pattern.search("world only"))
-        self.assertEqual(pattern.search("hello world").span(), (0, 5))
+        pattern = self.hello
+        self.assertTrue(pattern.search(_TEXT_HELLO_WORLD))
+        self.assertFalse(pattern.search("world only"))
+        self.assertEqual(pattern.search(_TEXT_HELLO_WORLD).span(), (0, 5))
 
 
 class ReMatchTests(unittest.TestCase):
@@ -48,20 +116,23 @@ class ReMatchTests(unittest.TestCase):
     Use search() with anchored patterns (^) instead for match-like behavior.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        cls.anchored_x_plus = _my(r"^x+")
+
     def test_search_anchored_like_match(self):
         """Test anchored search behaves like match"""
         # Use ^ anchor to simulate match() behavior
-        self.assertEqual(re.search(r"^a*", "xxx").span(), (0, 0))
-        self.assertEqual(re.search(r"^a*", "xxx").string, "xxx")
-        self.assertEqual(re.search(r"^x*", "xxx").span(), (0, 3))
-        self.assertEqual(re.search(r"^x+", "xxx").span(), (0, 3))
-        self.assertEqual(re.search(r"^x", "xxx").span(), (0, 1))
-        self.assertIsNone(re.search(r"^a", "xxx"))
+        for pattern, text, expected in _ANCHORED_CASES:
+            with self.subTest(pattern=pattern.pattern, text=text):
+                match = pattern.search(text)
+                self.assertEqual(match and match.span(), expected)
+                if match:
+                    self.assertEqual(match.string, text)
 
     def test_search_with_myre_anchored(self):
         """myre with ^ anchor should behave like match"""
-        pattern = MatchAny.compile(r"^x+")
-        match = pattern.search("xxx")
+        match = self.anchored_x_plus.search(_TEXT_XXX)
         self.assertEqual(match.span(), (0, 3))
         self.assertEqual(match.group(), "xxx")
 
@@ -69,144 +140,253 @@ class ReMatchTests(unittest.TestCase):
 class ReFindallTests(unittest.TestCase):
     """Tests for findall() method - adapted from test_re.py"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.digits = _my(r"\d+")
+        cls.a_plus = _my(r"a+")
+
     def test_findall_basic(self):
         """Test findall functionality"""
         # From stdlib: test_re_findall
-        self.assertEqual(re.findall(r"\d+", "1 2 3 4"), ["1", "2", "3", "4"])
-        self.assertEqual(re.findall(r"a+", "aaaaa"), ["aaaaa"])
+        for pattern, text, expected in _FINDALL_CASES:
+            with self.subTest(pattern=pattern.pattern, text=text):
+                self.assertEqual(tuple(pattern.findall(text)), expected)
 
     def test_findall_with_myre(self):
         """myre should produce same results"""
-        pattern = MatchAny.compile(r"\d+")
-        self.assertEqual(pattern.findall("1 2 3 4"), ["1", "2", "3", "4"])
-
-        pattern = MatchAny.compile(r"a+")
-        self.assertEqual(pattern.findall("aaaaa"), ["aaaaa"])
+        self.assertEqual(tuple(self.digits.findall(_TEXT_DIGITS)), _EXPECTED_DIGITS)
+        self.assertEqual(tuple(self.a_plus.findall("aaaaa")), ("aaaaa",))
+
+    def test_findall_literal_alternation(self):
+        """Literal alternatives should match like the same | alternation in re"""
+        pattern = _my("worl", "world", "hello")
+        text = "say hello world, hello worl"
+        self.assertEqual(pattern.findall(text), _RE_WORL_WORLD_HELLO.findall(text))
+        self.assertEqual(pattern.findall(text, 5, 20), _RE_WORL_WORLD_HELLO.findall(text, 5, 20))
+        self.assertEqual(pattern.findall("nothing here"), [])
+
+    def test_findall_empty_literal_alternative(self):
+        """An empty literal alternative matches everywhere, also at a pos past the text"""
+        pattern = _my("B", "")
+        text = "aB::Ab"
+        for pos in (0, 3, 6, 7):
+            with self.subTest(pos=pos):
+                self.assertEqual(pattern.findall(text, pos), _RE_B_OR_EMPTY.findall(text, pos))
+                self.assertEqual(
+                    [m.span() for m in pattern.finditer(text, pos)],
+                    [m.span() for m in _RE_B_OR_EMPTY.finditer(text, pos)],
+                )
+
+    def test_findall_returns_whole_match_with_groups(self):
+        """Unlike re, findall returns whole matches even when alternatives have groups"""
+        pattern = _my(r"(\d+)-(\d+)", r"(?P<word>[a-z]+)")
+        self.assertEqual(pattern.findall("12-34 ab 5-6"), ["12-34", "ab", "5-6"])
+        self.assertEqual(pattern.findall("12-34 ab 5-6"), [m.group() for m in pattern.finditer("12-34 ab 5-6")])
 
 
 class ReGroupTests(unittest.TestCase):
     """Tests for group functionality - adapted from test_re.py"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.two_groups = _my(r"^(\w)(\w+)")
+
     def test_groups(self):
         """Test capturing groups"""
         # From stdlib: test_group
-        self.assertEqual(re.match(r"(\w)(\w+)", "abcd").groups(), ("a", "bcd"))
-        self.assertEqual(re.match(r"(\w)(\w+)", "abcd").group(1), "a")
-        self.assertEqual(re.match(r"(\w)(\w+)", "abcd").group(2), "bcd")
-        self.assertEqual(re.match(r"(\w)(\w+)", "abcd").group(), "abcd")
+        match = _RE_TWO_GROUPS.match(_TEXT_ABCD)
+        self.assertEqual(match.groups(), ("a", "bcd"))
+        self.assertEqual(match.group(1), "a")
+        self.assertEqual(match.group(2), "bcd")
+        self.assertEqual(match.group(), "abcd")
 
     def test_groups_with_myre(self):
         """myre should support groups same as re"""
-        pattern = MatchAny.compile(r"^(\w)(\w+)")
-        match = pattern.search("abcd")
+        match = self.two_groups.search(_TEXT_ABCD)
         self.assertEqual(match.groups(), ("a", "bcd"))
         self.assertEqual(match.group(1), "a")
         self.assertEqual(match.group(2), "bcd")
         self.assertEqual(match.group(), "abcd")
 
+    def test_groups_with_multiple_patterns(self):
+        """Groups of the matching alternative are reported as if it ran alone"""
+        pattern = _my(r"(\d+)-(\d+)", r"([a-z]+)")
+        matches = list(pattern.finditer("abc 12-34"))
+        self.assertEqual([m.groups() for m in matches], [("abc",), ("12", "34")])
+        self.assertEqual(matches[1].group(2), "34")
+
+    def test_groups_after_empty_match_at_same_position(self):
+        """A hit forced past its branch's empty first choice still reports that branch's groups"""
+        pattern = _my(r"|(a)(?=b)", r"zz")
+        self.assertEqual(
+            [(m.span(), m.groups()) for m in pattern.finditer("ab")],
+            [(m.span(), m.groups()) for m in _RE_EMPTY_OR_A_BEFORE_B.finditer("ab")],
+        )
+
 
 class ReFinditerTests(unittest.TestCase):
     """Tests for finditer() method"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.digits = _my(r"\d+")
+
     def test_finditer_basic(self):
         """Test finditer functionality"""
         # From stdlib: test_finditer
-        pattern = MatchAny.compile(r"\d+")
-        matches = list(pattern.finditer("1 23 456"))
-        self.assertEqual(len(matches), 3)
-        self.assertEqual(matches[0].group(), "1")
-        self.assertEqual(matches[1].group(), "23")
-        self.assertEqual(matches[2].group(), "456")
-
-        # Check spans
-        self.assertEqual(matches[0].span(), (0, 1))
-        self.assertEqual(matches[1].span(), (2, 4))
-        self.assertEqual(matches[2].span(), (5, 8))
+        matches = self.digits.finditer("1 23 456")
+        for group, span in (("1", (0, 1)), ("23", (2, 4)), ("456", (5, 8))):
+            match = next(matches)
+            self.assertEqual(match.group(), group)
+            self.assertEqual(match.span(), span)
+        self.assertRaises(StopIteration, next, matches)
+
+    def test_finditer_nested_empty_alternatives(self):
+        """Nested alternatives that match empty yield each empty match once, like re"""
+        pattern = MatchAny((_my(r"x*"), _my(r"")))
+        for text in ("ab", "axxb", ""):
+            with self.subTest(text=text):
+                self.assertEqual(
+                    [m.span() for m in pattern.finditer(text)],
+                    [m.span() for m in _RE_X_STAR_OR_EMPTY.finditer(text)],
+                )
 
 
 class ReFlagTests(unittest.TestCase):
     """Tests for regex flags - adapted from test_re.py"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.hello_i = _my(r"hello", flag=re.IGNORECASE)
+        cls.line_start_m = _my(r"^test", flag=re.M)
+        cls.dot_plus_s = _my(r"^.+", flag=re.S)
+
     def test_ignore_case(self):
         """Test IGNORECASE flag"""
         # From stdlib: test_ignore_case
-        pattern = MatchAny.compile(r"hello", flag=re.IGNORECASE)
-        self.assertIsNotNone(pattern.search("HELLO"))
-        self.assertIsNotNone(pattern.search("HeLLo"))
-        self.assertIsNotNone(pattern.search("hello"))
+        for text in ("HELLO", "HeLLo", "hello"):
+            with self.subTest(text=text):
+                self.assertTrue(self.hello_i.search(text))
+
+    def test_ignore_case_literal_alternation(self):
+        """IGNORECASE literal alternatives should match like re, also far into long text"""
+        pattern = _my(r"cat", r"Dog", flag=re.IGNORECASE)
+        expected = _RE_CAT_DOG_I
+        for text in ("a CAT and a dOG", "x" * 5000 + "Cat" + "x" * 9000 + "DOG", "Ǆ cAt"):
+            self.assertEqual(pattern.findall(text), expected.findall(text))
+            self.assertEqual(pattern.search(text, 1).span(), expected.search(text, 1).span())
+
+    def test_ignore_case_empty_literal_alternative(self):
+        """IGNORECASE alternatives with an empty literal match empty at the end, like re"""
+        pattern = _my("", "x", flag=re.IGNORECASE)
+        for text, pos in (("ab", 2), ("ab", 0), ("", 0), ("aXb", 1)):
+            with self.subTest(text=text, pos=pos):
+                self.assertEqual(pattern.findall(text, pos), _RE_EMPTY_OR_X_I.findall(text, pos))
 
     def test_multiline(self):
         """Test MULTILINE flag"""
         # Basic multiline test
-        pattern = MatchAny.compile(r"^test", flag=re.M)
-        self.assertIsNotNone(pattern.search("line1\ntest\nline3"))
+        self.assertTrue(self.line_start_m.search("line1\ntest\nline3"))
 
     def test_dotall(self):
         """Test DOTALL flag"""
         # From stdlib: test_ignore_case
-        pattern = MatchAny.compile(r"^.+", flag=re.S)
-        self.assertEqual(pattern.search("hello\nworld").group(), "hello\nworld")
+        self.assertEqual(self.dot_plus_s.search("hello\nworld").group(), "hello\nworld")
 
 
 class ReEdgeCaseTests(unittest.TestCase):
     """Edge cases and special scenarios"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.z = _my(r"z")
+        cls.digits_or_word = _my(r"\d+", r"\w+")
+        cls.hello_start = _my(r"^hello")
+        cls.world_end = _my(r"world$")
+
     def test_empty_pattern(self):
         """Test behavior with empty pattern"""
         # Empty pattern matches at each position
-        pattern = MatchAny.compile(r"")
+        pattern = _my(r"")
         matches = pattern.findall("hello")
         self.assertIsInstance(matches, list)
         # Empty pattern should match at string boundaries at minimum
 
     def test_no_match(self):
         """Test when pattern doesn't match"""
-        pattern = MatchAny.compile(r"z")
-        matches = pattern.findall("hello world")
+        matches = self.z.findall(_TEXT_HELLO_WORLD)
         self.assertEqual(matches, [])
 
+    def test_no_match_large(self):
+        """Test a miss over a long text, for one literal, literal alternatives and bytes"""
+        text = _TEXT_HELLO_WORLD * 100_000
+        self.assertEqual(self.z.findall(text), _RE_Z.findall(text))
+        self.assertEqual(_my(r"z", r"q").findall(text), _RE_Z_OR_Q.findall(text))
+
+        data = text.encode("ascii")
+        self.assertEqual(_my(_RE_Z_BYTES).findall(data), _RE_Z_BYTES.findall(data))
+        self.assertEqual(_RE_Z_BYTES.findall(data), [])
+
+    def test_position_past_end_of_composed_alternatives(self):
+        """Test pos beyond the text or endpos behaves like re for composed alternatives"""
+        pattern = MatchAny.compile(*(_my(source) ^ "\x00" for source in ("", "b?", "a")))
+        for text, pos, endpos in (("", 3, sys.maxsize), ("a", 2, 1), ("ab", 5, 1)):
+            with self.subTest(text=text, pos=pos, endpos=endpos):
+                self.assertEqual(pattern.findall(text, pos, endpos), _RE_EMPTY_B_OR_A.findall(text, pos, endpos))
+
     def test_special_characters(self):
         """Test special regex characters"""
         # From stdlib: test_special_escapes
-        pattern = MatchAny.compile(r"\d+", r"\w+")
+        pattern = self.digits_or_word
         text = "123abc 456def"
-        matches = pattern.findall(text)
-        self.assertEqual(len(matches), 2)
+        # One pass yields both the text and the spans findall alone cannot check
+        matches = [(m.group(), m.span()) for m in pattern.finditer(text)]
+        self.assertEqual(matches, [(m.group(), m.span()) for m in _RE_DIGITS_OR_WORD.finditer(text)])
+        # Was 2 before MatchAny fused its alternatives; see test_overlapping_alternatives
+        self.assertEqual(len(matches), 4)
+
+    def test_overlapping_alternatives(self):
+        """Overlapping alternatives are tried left to right at each position, like re's "|"
+
+        Earlier releases dropped a later alternative's hit when it overlapped one already
+        taken, so digits-then-word found ["123", "456def"] in "123abc 456def".
+        """
+        text = "123abc 456def"
+        self.assertEqual(self.digits_or_word.findall(text), ["123", "abc", "456", "def"])
+        self.assertEqual(self.digits_or_word.findall(text), _RE_DIGITS_OR_WORD.findall(text))
+
+        word_or_digits = _my(r"\w+", r"\d+")
+        self.assertEqual(word_or_digits.findall(text), ["123abc", "456def"])
 
     def test_anchored_patterns(self):
         """Test ^ and $ anchors"""
-        pattern = MatchAny.compile(r"^hello")
-        self.assertIsNotNone(pattern.search("hello world"))
-        self.assertIsNone(pattern.search("say hello"))
-
-        pattern = MatchAny.compile(r"world$")
-        self.assertIsNotNone(pattern.search("hello world"))
-        self.assertIsNone(pattern.search("world hello"))
+        cases = (
+            (self.hello_start, _TEXT_HELLO_WORLD, True),
+            (self.hello_start, "say hello", False),
+            (self.world_end, _TEXT_HELLO_WORLD, True),
+            (self.world_end, "world hello", False),
+        )
+        for pattern, text, found in cases:
+            with self.subTest(pattern=pattern.patterns[0].pattern, text=text):
+                self.assertEqual(bool(pattern.search(text)), found)
 
 
 class ReMatchObjectTests(unittest.TestCase):
     """Tests for match object attributes and methods"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.hello = _my(r"hello")
+        cls.word = _my(r"(\w+)")
+
     def test_match_attributes(self):
         """Test match object has required attributes"""
-        pattern = MatchAny.compile(r"hello")
-        match = pattern.search("hello world")
-
-        # Required attributes from MatchLike protocol
-        self.assertTrue(hasattr(match, "re"))
-        self.assertTrue(hasattr(match, "string"))
-
-        # Required methods from MatchLike protocol
-        self.assertTrue(hasattr(match, "start"))
-        self.assertTrue(hasattr(match, "end"))
-        self.assertTrue(hasattr(match, "span"))
-        self.assertTrue(hasattr(match, "group"))
-        self.assertTrue(hasattr(match, "groups"))
+        match = self.hello.search(_TEXT_HELLO_WORLD)
+        self.assertEqual(_REQUIRED_MATCH_ATTRS - set(dir(match)), frozenset())
 
     def test_match_methods_work(self):
         """Test that match methods actually work"""
-        pattern = MatchAny.compile(r"(\w+)")
-        match = pattern.search("hello world")
+        match = self.word.search(_TEXT_HELLO_WORLD)
 
         self.assertEqual(match.start(), 0)
         self.assertEqual(match.end(), 5)
@@ -228,33 +408,55 @@ class RePatternTests(unittest.TestCase):
         pattern = MatchAny.compile(r"hello", r"world", r"test")
         self.assertEqual(len(pattern.patterns), 3)
 
+    def test_compile_reuses_compiled_patterns(self):
+        """Test compiling the same source twice shares the compiled regex"""
+        first = MatchAny.compile(r"hello", r"world")
+        second = MatchAny.compile(r"hello", r"world")
+        self.assertIs(first.patterns[0], second.patterns[0])
+        self.assertIsNot(first.patterns[0], MatchAny.compile(r"hello", flag=re.I).patterns[0])
+        self.assertEqual(first.findall(_TEXT_HELLO_WORLD), second.findall(_TEXT_HELLO_WORLD))
+        self.assertEqual(
+            [m.span() for m in first.finditer(_TEXT_HELLO_WORLD)],
+            [m.span() for m in second.finditer(_TEXT_HELLO_WORLD)],
+        )
+
     def test_compile_with_flags(self):
         """Test compiling with flags"""
-        pattern = MatchAny.compile(r"hello", r"world", flag=re.I)
-        self.assertIsNotNone(pattern.search("HELLO WORLD"))
+        pattern = _my(r"hello", r"world", flag=re.I)
+        self.assertTrue(pattern.search(_TEXT_HELLO_WORLD_UPPER))
 
 
 class MatchALLBasicTests(unittest.TestCase):
     """Basic tests for MatchALL - testing combined matches"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.hello_and_world = MatchALL.compile(r"hello", r"world")
+        cls.hello_and_foobar = MatchALL.compile(r"hello", r"foobar")
+        cls.hello_and_world_i = MatchALL.compile(r"hello", r"world", flag=re.I)
+
     def test_matchall_both_patterns_exist(self):
         """Test MatchALL when all patterns match"""
-        pattern = MatchALL.compile(r"hello", r"world")
-        matches = pattern.findall("hello world")
+        matches = self.hello_and_world.findall(_TEXT_HELLO_WORLD)
         self.assertEqual(len(matches), 1)
         # Returns one combined match
 
     def test_matchall_one_pattern_missing(self):
         """Test MatchALL when one pattern doesn't match"""
-        pattern = MatchALL.compile(r"hello", r"foobar")
-        matches = pattern.findall("hello world")
+        matches = self.hello_and_foobar.findall(_TEXT_HELLO_WORLD)
         # 'foobar' doesn't match, so no results
         self.assertEqual(len(matches), 0)
 
+    def test_matchall_respects_position(self):
+        """Test MatchALL only looks for its patterns inside pos/endpos"""
+        pattern = self.hello_and_world
+        self.assertEqual(len(pattern.findall(_TEXT_HELLO_WORLD, 1)), 0)
+        self.assertEqual(len(pattern.findall(_TEXT_HELLO_WORLD, 0, 10)), 0)
+        self.assertEqual(pattern.findall("say hello\nworld", 4), ["hello\nworld"])
+
     def test_matchall_with_flags(self):
         """Test MatchALL respects regex flags"""
-        pattern = MatchALL.compile(r"hello", r"world", flag=re.I)
-        matches = pattern.findall("HELLO WORLD")
+        matches = self.hello_and_world_i.findall(_TEXT_HELLO_WORLD_UPPER)
         self.assertEqual(len(matches), 1)
 
 